@@ -1,25 +1,42 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sqlite3
 import os
+import io
+import re
+import queue
 import threading
+from contextlib import contextmanager
 from datetime import datetime
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional; only used for the "did you mean" hint on new item IDs
+    process = None
 
 # ==========================================================
 # ---- CONFIGURATION ----
 # ==========================================================
 DB_PATH = r"\\bioblrnas\msat\inventory.db"
+# WAL needs shared memory between all clients of the file, which network shares
+# can't provide, and the mode sticks to the file for every other client too.
+# Only enable it for a DB on local disk; UNC paths keep the rollback journal.
+USE_WAL = not DB_PATH.startswith(("\\\\", "//"))
 
 st.set_page_config(page_title="Inventory Management", layout="wide")
 st.title("📦 Inventory Management")
 
+def db_mtime():
+    # in WAL mode commits land in the -wal file until a checkpoint
+    return max(os.path.getmtime(p) for p in (DB_PATH, DB_PATH + "-wal") if os.path.exists(p))
+
 # ---- Show DB details in sidebar ----
 st.sidebar.write("### 🗂️ Database Info")
 st.sidebar.write(f"📁 **Path:** `{DB_PATH}`")
 st.sidebar.write(f"✅ Exists: {os.path.exists(DB_PATH)}")
 
 if os.path.exists(DB_PATH):
-    mtime = datetime.fromtimestamp(os.path.getmtime(DB_PATH)).strftime("%Y-%m-%d %H:%M:%S")
+    mtime = datetime.fromtimestamp(db_mtime()).strftime("%Y-%m-%d %H:%M:%S")
     st.sidebar.write(f"🕒 **Last Modified:** {mtime}")
 else:
     st.sidebar.warning("⚠️ Database not found — will be created automatically.")
@@ -27,14 +44,78 @@ else:
 # ==========================================================
 # ---- DATABASE HANDLING ----
 # ==========================================================
-lock = threading.Lock()  # ensures thread-safe writes
+READ_POOL_SIZE = 4
+
+def open_connection():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    if USE_WAL:
+        conn.execute("PRAGMA journal_mode=WAL")    # readers don't block the writer
+        conn.execute("PRAGMA synchronous=NORMAL")  # fsync at checkpoints, not every commit
+    else:
+        conn.execute("PRAGMA journal_mode=DELETE")  # undo WAL on a file an earlier run switched over
+    conn.execute("PRAGMA busy_timeout=5000")   # wait for locks instead of "database is locked"
+    conn.execute("PRAGMA cache_size=-32000")   # ~32 MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+@st.cache_resource
+def get_pool():
+    # Long-lived connections shared across reruns and sessions: a single writer
+    # (so writes serialize) and a few readers. LIFO hands out the most recently
+    # returned connection, whose page cache is still hot.
+    writers = queue.LifoQueue(maxsize=1)
+    readers = queue.LifoQueue(maxsize=READ_POOL_SIZE)
+    writers.put(open_connection())
+    for _ in range(READ_POOL_SIZE):
+        readers.put(open_connection())
+    return writers, readers
+
+@contextmanager
+def _checkout(pool):
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
+
+def acquire_read():
+    return _checkout(get_pool()[1])
 
-def get_connection():
-    return sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+def acquire_write():
+    return _checkout(get_pool()[0])
 
+def clear_caches():
+    _load_inventory.clear()
+    get_low_stock.clear()
+    search_inventory.clear()
+    to_csv_bytes.clear()
+    get_item_ids.clear()
+
+# Columns added after the first release; older DB files get them on startup
+MIGRATED_COLUMNS = [
+    ("currency", "TEXT", "'USD'"),
+    ("reorder_level", "REAL", "70.0"),
+    ("reorder_triggered", "INTEGER", "0"),
+]
+
+# Explicit dtypes at load: numeric columns as native floats (no object fallback
+# in the overview math), low-cardinality labels as categoricals, free text as
+# Arrow-backed strings (pyarrow ships with streamlit)
+INVENTORY_DTYPES = {
+    "quantity": "float64",
+    "price": "float64",
+    "reorder_level": "float64",
+    "currency": "category",
+    "uom": "category",
+    "item_id": "string[pyarrow]",
+    "item_name": "string[pyarrow]",
+    "category": "string[pyarrow]",
+}
+
+@st.cache_resource
 def init_db():
-    with lock:
-        conn = get_connection()
+    # cached: schema setup runs once per process, not on every rerun
+    with acquire_write() as conn:
         c = conn.cursor()
         c.execute('''
         CREATE TABLE IF NOT EXISTS inventory (
@@ -49,65 +130,182 @@ def init_db():
             reorder_triggered INTEGER DEFAULT 0
         )
         ''')
+        cols = {row[1] for row in c.execute("PRAGMA table_info(inventory)")}
+        for col, col_type, default in MIGRATED_COLUMNS:
+            if col not in cols:
+                c.execute(f"ALTER TABLE inventory ADD COLUMN {col} {col_type} DEFAULT {default}")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_lowstock ON inventory(reorder_triggered, quantity)")
         conn.commit()
-        conn.close()
+
+        # The search index is built per host (see _load_inventory), not stored in
+        # this shared file: its triggers would make every write fail on a host
+        # whose SQLite lacks FTS5. Remove the ones earlier versions created.
+        for trigger in ("inv_fts_ai", "inv_fts_ad", "inv_fts_au"):
+            c.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        fts5 = c.execute("SELECT 1 FROM pragma_module_list WHERE name='fts5'").fetchone() is not None
+        if fts5:  # a table whose module is missing can't be dropped
+            c.execute("DROP TABLE IF EXISTS inv_fts")
+        conn.commit()
+        return fts5
 
 def add_or_update_item(item_id, item_name, category, quantity, uom, price, currency, reorder_level):
-    with lock:
-        conn = get_connection()
+    with acquire_write() as conn:
         c = conn.cursor()
-        c.execute("SELECT * FROM inventory WHERE item_id=?", (item_id,))
-        if c.fetchone():
-            c.execute("""
-                UPDATE inventory
-                SET item_name=?, category=?, quantity=?, uom=?, price=?, currency=?, reorder_level=?, reorder_triggered=0
-                WHERE item_id=?
-            """, (item_name, category, quantity, uom, price, currency, reorder_level, item_id))
-        else:
-            c.execute("""
-                INSERT INTO inventory (item_id, item_name, category, quantity, uom, price, currency, reorder_level)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (item_id, item_name, category, quantity, uom, price, currency, reorder_level))
+        c.execute("""
+            INSERT INTO inventory (item_id, item_name, category, quantity, uom, price, currency, reorder_level)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(item_id) DO UPDATE SET
+                item_name=excluded.item_name, category=excluded.category, quantity=excluded.quantity,
+                uom=excluded.uom, price=excluded.price, currency=excluded.currency,
+                reorder_level=excluded.reorder_level, reorder_triggered=0
+        """, (item_id, item_name, category, quantity, uom, price, currency, reorder_level))
         conn.commit()
-        conn.close()
+    clear_caches()
 
-def get_inventory():
-    conn = get_connection()
-    df = pd.read_sql("SELECT * FROM inventory", conn)
-    conn.close()
+def _prepare_inventory(df):
+    # typed columns plus a preformatted price for the grid, built once per cached load
+    df = df.astype(INVENTORY_DTYPES)
+    df['price_display'] = df['currency'].astype(str) + ' ' + np.char.mod('%.2f', df['price'].to_numpy())
     return df
 
+def _build_fts_index(df):
+    # in-memory FTS5 index over name + category, rowid = row position in df
+    index = sqlite3.connect(":memory:", check_same_thread=False)
+    index.execute("CREATE VIRTUAL TABLE inv_fts USING fts5(item_name, category)")
+    index.executemany(
+        "INSERT INTO inv_fts(rowid, item_name, category) VALUES (?, ?, ?)",
+        zip(range(len(df)),
+            df['item_name'].astype(object).where(df['item_name'].notna(), None),
+            df['category'].astype(object).where(df['category'].notna(), None)),
+    )
+    return index
+
+_fts_lock = threading.Lock()  # the cached index connection is shared across sessions
+
+@st.cache_resource(ttl=30, show_spinner=False)
+def _load_inventory(mtime):
+    with acquire_read() as conn:
+        df = _prepare_inventory(pd.read_sql("SELECT * FROM inventory", conn))
+    # search index built in the same entry so it always lines up with the frame:
+    # FTS5 where this host's SQLite has it, else lowered "name \x1f category" per row
+    if fts_enabled:
+        return df, _build_fts_index(df)
+    return df, (df['item_name'].fillna('') + '\x1f' + df['category'].fillna('')).str.lower()
+
+def get_inventory(mtime):
+    # cache_resource shares one frame instead of unpickling a copy on every hit;
+    # callers modify what they get back, so hand out a cheap in-memory copy
+    return _load_inventory(mtime)[0].copy()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def search_inventory(term, mtime):
+    # every word must start a word in name or category, e.g. "blue bo" finds
+    # "Blue Bolt" but "lue" doesn't; both index kinds match the same way
+    words = term.split()
+    df, index = _load_inventory(mtime)
+    if not words:
+        return df
+    if fts_enabled:
+        query = " ".join('"' + w.replace('"', '""') + '"*' for w in words)
+        with _fts_lock:
+            rows = index.execute("SELECT rowid FROM inv_fts WHERE inv_fts MATCH ? ORDER BY rowid", (query,))
+            return df.iloc[[row[0] for row in rows]]
+    # same rule as FTS5 tokens: runs of word characters, the last one a prefix
+    mask = np.ones(len(df), dtype=bool)
+    for word in words:
+        tokens = re.findall(r"\w+", word.lower())
+        if not tokens:
+            return df.iloc[:0]
+        pattern = r"(?<!\w)" + r"[^\w\x1f]+".join(map(re.escape, tokens))
+        mask &= index.str.contains(pattern, regex=True, na=False).to_numpy()
+    return df[mask]
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_low_stock(mtime):
+    # items below threshold that haven't been ordered yet
+    with acquire_read() as conn:
+        df = pd.read_sql("""
+            SELECT item_name, quantity, uom, reorder_level FROM inventory
+            WHERE reorder_triggered = 0 AND quantity < reorder_level
+        """, conn)
+    # text as Arrow strings so the alert message is concatenated by Arrow kernels
+    return df.astype({"item_name": "string[pyarrow]", "uom": "string[pyarrow]"})
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_item_ids(mtime):
+    with acquire_read() as conn:
+        return [row[0] for row in conn.execute("SELECT item_id FROM inventory ORDER BY item_id")]
+
+def similar_item_id(item_id, item_ids):
+    # closest existing ID to a new one (likely a typo), e.g. "BLT-1004" -> "BLT-104"
+    if process is None or item_id in item_ids:
+        return None
+    hit = process.extractOne(item_id, item_ids, scorer=fuzz.ratio, score_cutoff=90)
+    return hit[0] if hit else None
+
+def get_item(item_id):
+    with acquire_read() as conn:
+        c = conn.cursor()
+        c.row_factory = sqlite3.Row
+        return c.execute("SELECT * FROM inventory WHERE item_id=?", (item_id,)).fetchone()
+
+# Once stock is back at or above the threshold the order is considered received,
+# so the item can raise a low-stock alert again next time it runs short
+RESTOCK_SQL = """
+    UPDATE inventory
+    SET quantity = quantity + :change,
+        reorder_triggered = CASE WHEN quantity + :change >= reorder_level THEN 0 ELSE reorder_triggered END
+    WHERE item_id = :item_id
+"""
+
 def update_stock(item_id, change):
-    with lock:
-        conn = get_connection()
+    with acquire_write() as conn:
         c = conn.cursor()
-        c.execute("UPDATE inventory SET quantity = quantity + ? WHERE item_id = ?", (change, item_id))
+        c.execute(RESTOCK_SQL, {"change": change, "item_id": item_id})
         conn.commit()
-        conn.close()
+    clear_caches()
+
+def apply_batch(changes):
+    # changes: [(item_id, change), ...] applied in one transaction, i.e. one fsync on the share
+    with acquire_write() as conn:
+        c = conn.cursor()
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            c.executemany(RESTOCK_SQL, [{"change": change, "item_id": item_id} for item_id, change in changes])
+            c.execute("COMMIT")
+        except sqlite3.Error:
+            c.execute("ROLLBACK")
+            raise
+    clear_caches()
 
 def delete_item(item_id):
-    with lock:
-        conn = get_connection()
+    with acquire_write() as conn:
         c = conn.cursor()
         c.execute("DELETE FROM inventory WHERE item_id=?", (item_id,))
         conn.commit()
-        conn.close()
+    clear_caches()
 
 def mark_ordered(item_id):
-    with lock:
-        conn = get_connection()
+    with acquire_write() as conn:
         c = conn.cursor()
         c.execute("UPDATE inventory SET reorder_triggered = 1 WHERE item_id=?", (item_id,))
         conn.commit()
-        conn.close()
+    clear_caches()
+
+CSV_CHUNK_ROWS = 50_000
 
-def highlight_low_stock(row):
-    if row['quantity'] < row['reorder_level']:
-        return ['background-color: #FF9999'] * len(row)
-    return [''] * len(row)
+@st.cache_data(ttl=30, max_entries=8, show_spinner=False)
+def to_csv_bytes(mtime, search_term, _df):
+    # _df is not hashed; the DB mtime and search term already identify its contents.
+    # Encoded chunk by chunk straight into the buffer, so the whole table never
+    # exists as one big str alongside its bytes.
+    buf = io.BytesIO()
+    for start in range(0, max(len(_df), 1), CSV_CHUNK_ROWS):
+        _df.iloc[start:start + CSV_CHUNK_ROWS].to_csv(buf, index=False, header=start == 0, encoding="utf-8")
+    return buf.getvalue()
 
 # Initialize DB once
-init_db()
+fts_enabled = init_db()
 
 # ==========================================================
 # ---- TABS ----
@@ -117,46 +315,54 @@ tab1, tab2, tab3 = st.tabs(["Inventory Overview", "Add / Update Item", "Stock Ma
 # ==========================================================
 # ---- TAB 1: OVERVIEW ----
 # ==========================================================
-with tab1:
+@st.fragment
+def render_overview():
     st.subheader("📊 Current Inventory")
 
     if st.button("🔄 Refresh Inventory"):
+        clear_caches()
         st.rerun()
 
-    df = get_inventory()
+    # form: the term is only submitted on Enter / button, not on every keystroke
+    with st.form("search_form"):
+        search_term = st.text_input(
+            "🔍 Search by Item Name or Category",
+            help="Finds words starting with what you type, e.g. 'bo' matches 'Blue Bolt'",
+        )
+        st.form_submit_button("Search")
+    mtime = db_mtime()
+    df = search_inventory(search_term, mtime) if search_term else get_inventory(mtime)
 
-    search_term = st.text_input("🔍 Search by Item Name or Category")
-    if search_term:
-        df = df[df['item_name'].str.contains(search_term, case=False) |
-                df['category'].str.contains(search_term, case=False)]
+    # Summary figures from the raw numeric columns, before price is formatted for display
+    total_items = len(df)
+    total_qty = df["quantity"].sum() if not df.empty else 0
+    total_value = float(np.nansum(df['quantity'].to_numpy() * df['price'].to_numpy()))
 
     # Low-stock warning
-    low_stock = df[df['quantity'] < df['reorder_level']]
+    low_stock = get_low_stock(mtime)
     if not low_stock.empty:
-        st.warning(
-            "⚠️ Low Stock Alert:\n" +
-            "\n".join([
-                f"{row['item_name']} ({row['quantity']} {row['uom']} — threshold {row['reorder_level']})"
-                for _, row in low_stock.iterrows()
-            ])
-        )
+        lines = (low_stock['item_name'].fillna('') + ' (' + low_stock['quantity'].astype(str) + ' ' +
+                 low_stock['uom'].fillna('') + ' — threshold ' + low_stock['reorder_level'].astype(str) + ')')
+        st.warning("⚠️ Low Stock Alert:\n" + "\n".join(lines.tolist()))
 
     if not df.empty:
-        df['price'] = df.apply(lambda x: f"{x['currency']} {x['price']:.2f}", axis=1)
-        st.dataframe(df.style.apply(highlight_low_stock, axis=1), use_container_width=True)
+        # price formatting and the low-stock badge are rendered client-side from plain columns
+        df['low_stock'] = df['quantity'].to_numpy() < df['reorder_level'].to_numpy()
+        st.dataframe(
+            df,
+            column_order=[col for col in df.columns if col != 'price_display'],
+            column_config={
+                "price": st.column_config.NumberColumn(format="%.2f"),
+                "low_stock": st.column_config.CheckboxColumn("low stock"),
+            },
+            width="stretch",
+            hide_index=True,
+        )
     else:
         st.info("No items in inventory yet.")
 
     # Summary statistics
     st.subheader("📈 Summary Statistics")
-    total_items = len(df)
-    total_qty = df["quantity"].sum() if not df.empty else 0
-    try:
-        df["numeric_price"] = pd.to_numeric(df["price"].str.replace("[^0-9.]", "", regex=True), errors="coerce")
-        total_value = (df["quantity"] * df["numeric_price"]).sum()
-    except Exception:
-        total_value = 0
-
     c1, c2, c3 = st.columns(3)
     c1.metric("Total Items", total_items)
     c2.metric("Total Quantity", total_qty)
@@ -164,63 +370,116 @@ with tab1:
 
     # Export option
     if not df.empty:
-        csv = df.to_csv(index=False).encode("utf-8")
-        st.download_button("📥 Export Inventory to CSV", csv, "inventory_export.csv", "text/csv")
+        def export_csv():
+            # run on click only; exported price keeps its "INR 12.00" text form
+            export = df.assign(price=df['price_display']).drop(columns=['price_display', 'low_stock'])
+            return to_csv_bytes(mtime, search_term, export)
+
+        st.download_button("📥 Export Inventory to CSV", export_csv, "inventory_export.csv", "text/csv")
+
+with tab1:
+    render_overview()
 
 # ==========================================================
 # ---- TAB 2: ADD / UPDATE ITEM ----
 # ==========================================================
-with tab2:
+@st.fragment
+def render_add_update():
     st.subheader("➕ Add or Update Item")
 
-    item_id = st.text_input("Item ID")
-    item_name = st.text_input("Item Name")
-    category = st.text_input("Category")
-    quantity = st.number_input("Quantity", min_value=0.0, step=1.0)
-    uom = st.text_input("Unit of Measurement (e.g., pcs, kg)")
-    price = st.number_input("Price per Unit", min_value=0.0, step=0.01)
-    currency = st.selectbox("Currency", ["USD", "EUR", "GBP", "INR"], index=3)
-    reorder_level = st.number_input("Reorder Threshold", min_value=0.0, step=1.0, value=70.0)
+    # form: field edits don't rerun the script, only the Save submit does
+    with st.form("add_update_form"):
+        item_id = st.text_input("Item ID", key="add_item_id")
+        item_name = st.text_input("Item Name", key="add_item_name")
+        category = st.text_input("Category", key="add_category")
+        quantity = st.number_input("Quantity", min_value=0.0, step=1.0, key="add_quantity")
+        uom = st.text_input("Unit of Measurement (e.g., pcs, kg)", key="add_uom")
+        price = st.number_input("Price per Unit", min_value=0.0, step=0.01, key="add_price")
+        currency = st.selectbox("Currency", ["USD", "EUR", "GBP", "INR"], index=3, key="add_currency")
+        reorder_level = st.number_input("Reorder Threshold", min_value=0.0, step=1.0, value=70.0,
+                                        key="add_reorder_level")
+        submitted = st.form_submit_button("💾 Save Item")
 
-    if st.button("💾 Save Item"):
+    if submitted:
         if item_id and item_name and uom:
-            add_or_update_item(item_id, item_name, category, quantity, uom, price, currency, reorder_level)
-            st.success(f"✅ Item '{item_name}' added/updated successfully!")
-            st.rerun()
+            similar_id = similar_item_id(item_id, get_item_ids(db_mtime()))
+            if similar_id and st.session_state.get("confirmed_new_id") != item_id:
+                # warn once; saving again with the same ID creates it as a new item
+                st.session_state.confirmed_new_id = item_id
+                st.warning(f"⚠️ Item ID '{item_id}' is new — did you mean '{similar_id}'? "
+                           "Click Save again to create it anyway.")
+            else:
+                add_or_update_item(item_id, item_name, category, quantity, uom, price, currency, reorder_level)
+                st.success(f"✅ Item '{item_name}' added/updated successfully!")
+                st.rerun()
         else:
             st.warning("⚠️ Item ID, Name, and UOM are required.")
 
+with tab2:
+    render_add_update()
+
 # ==========================================================
 # ---- TAB 3: STOCK MANAGEMENT ----
 # ==========================================================
-with tab3:
+@st.fragment
+def render_stock_mgmt():
     st.subheader("📦 Manage Stock")
-    df = get_inventory()
+    item_ids = get_item_ids(db_mtime())
 
-    if df.empty:
+    if not item_ids:
         st.info("No items to manage yet.")
     else:
-        selected_id = st.selectbox("Select Item ID", df["item_id"])
-        item_row = df[df["item_id"] == selected_id].iloc[0]
+        selected_id = st.selectbox("Select Item ID", item_ids)
+        item_row = get_item(selected_id)
+        if item_row is None:
+            # the cached ID list is stale, e.g. the item was deleted from another host
+            clear_caches()
+            st.info(f"Item '{selected_id}' no longer exists — refresh to update the list.")
+            return
         st.write(f"**Item Name:** {item_row['item_name']}")
         st.write(f"**Current Quantity:** {item_row['quantity']} {item_row['uom']}")
         st.write(f"**Reorder Threshold:** {item_row['reorder_level']}")
         st.write(f"**Reorder Triggered:** {'Yes' if item_row['reorder_triggered'] else 'No'}")
 
-        stock_change = st.number_input("Change Quantity (+/-)", value=0.0, step=1.0)
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("📈 Update Stock"):
+        # form: one rerun per applied action, not one per widget touched
+        with st.form("stock_form"):
+            stock_change = st.number_input("Change Quantity (+/-)", value=0.0, step=1.0)
+            action = st.radio("Action", ["📈 Update Stock", "🧺 Queue Change", "🛒 Mark as Ordered", "❌ Delete Item"],
+                              horizontal=True)
+            applied = st.form_submit_button("✔️ Apply")
+
+        pending = st.session_state.setdefault("pending", [])
+        if applied:
+            if action == "📈 Update Stock":
                 update_stock(selected_id, stock_change)
                 st.success("✅ Stock updated successfully!")
                 st.rerun()
-        with col2:
-            if st.button("🛒 Mark as Ordered"):
+            elif action == "🧺 Queue Change":
+                pending.append((selected_id, stock_change))
+            elif action == "🛒 Mark as Ordered":
                 mark_ordered(selected_id)
                 st.success("✅ Marked as ordered — low-stock notification stopped.")
                 st.rerun()
-        with col3:
-            if st.button("❌ Delete Item"):
+            elif action == "❌ Delete Item":
                 delete_item(selected_id)
                 st.success(f"Item '{item_row['item_name']}' deleted from inventory!")
-                st.rerun()
\ No newline at end of file
+                st.rerun()
+
+        # Queued changes are written together in a single transaction
+        if pending:
+            st.write("**Pending Changes:**")
+            st.dataframe(pd.DataFrame(pending, columns=["item_id", "change"]), hide_index=True)
+            c1, c2 = st.columns(2)
+            with c1:
+                if st.button("💾 Commit Changes"):
+                    apply_batch(pending)
+                    pending.clear()
+                    st.success("✅ Pending changes committed!")
+                    st.rerun()
+            with c2:
+                if st.button("🗑️ Discard Changes"):
+                    pending.clear()
+                    st.rerun()
+
+with tab3:
+    render_stock_mgmt()